@@ -505,3 +505,13 @@ class ZoneStates(DataClassORJSONMixin):
     zone_states: dict[str, ZoneState] = field(
         metadata=field_options(alias="zoneStates")
     )
+
+
+@dataclass
+class HomeSnapshot(DataClassORJSONMixin):
+    """HomeSnapshot model bundles the devices, zones and their states of a home."""
+
+    devices: list[Device]
+    mobile_devices: list[MobileDevice]
+    zones: list[Zone]
+    zone_states: list[ZoneStates]
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import json
-import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from importlib import metadata
-from typing import Self
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping, Self, TypeVar
 
 import orjson
-from aiohttp import ClientResponseError
+from aiohttp import ClientResponse, ClientResponseError, ClientTimeout, TCPConnector
 from aiohttp.client import ClientSession
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 from yarl import URL
 
 from tadoasync.const import (
@@ -41,11 +42,13 @@ from tadoasync.exceptions import (
     TadoConnectionError,
     TadoError,
     TadoForbiddenError,
+    TadoServerError,
 )
 from tadoasync.models import (
     Capabilities,
     Device,
     GetMe,
+    HomeSnapshot,
     HomeState,
     MobileDevice,
     SensorDataPoints,
@@ -66,7 +69,36 @@ TADO_API_PATH = "/api/v2"
 EIQ_URL = "energy-insights.tado.com/api"
 EIQ_HOST_URL = "energy-insights.tado.com"
 EIQ_API_PATH = "/api"
+TADO_API_BASE_URL = URL.build(scheme="https", host=TADO_HOST_URL, path=TADO_API_PATH)
+EIQ_API_BASE_URL = URL.build(scheme="https", host=EIQ_HOST_URL, path=EIQ_API_PATH)
 VERSION = metadata.version(__package__)
+USER_AGENT = f"HomeAssistant/{VERSION}"
+LOGIN_DATA = {
+    "client_id": CLIENT_ID,
+    "client_secret": CLIENT_SECRET,
+    "grant_type": "password",
+    "scope": "home.user",
+}
+REFRESH_DATA = {
+    "client_id": CLIENT_ID,
+    "client_secret": CLIENT_SECRET,
+    "grant_type": "refresh_token",
+    "scope": "home.user",
+}
+# Responses larger than this many bytes are parsed in an executor
+PARSE_IN_EXECUTOR_THRESHOLD = 16384
+
+STATUS_ERRORS: Mapping[int, tuple[type[TadoError], str]] = MappingProxyType(
+    {
+        400: (TadoBadRequestError, "Bad request to Tado"),
+        401: (TadoAuthenticationError, "Authentication error connecting to Tado"),
+        403: (TadoForbiddenError, "Forbidden error connecting to Tado"),
+        500: (TadoServerError, "Error 500 connecting to Tado"),
+    }
+)
+
+_T = TypeVar("_T")
+_ModelT = TypeVar("_ModelT", bound=DataClassORJSONMixin)
 
 
 @dataclass
@@ -94,6 +126,7 @@ class Tado:  # pylint: disable=too-many-instance-attributes
         self._debug: bool = debug or False
         self._session = session
         self._request_timeout = request_timeout
+        self._client_timeout = ClientTimeout(total=request_timeout, connect=5)
         self._close_session = False
 
         self._headers: dict[str, str] = {
@@ -104,118 +137,136 @@ class Tado:  # pylint: disable=too-many-instance-attributes
         self._access_token: str | None = None
         self._token_expiry: float | None = None
         self._refesh_token: str | None = None
-        self._access_headers: dict[str, str] | None = None
+        self._access_headers: dict[str, str] = {}
         self._home_id: int | None = None
+        self._home_base: URL | None = None
         self._me: GetMe | None = None
         self._auto_geofencing_supported: bool | None = None
+        self._auth_lock: asyncio.Lock | None = None
 
     async def login(self) -> None:
         """Perform login to Tado."""
         data = {
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "grant_type": "password",
-            "scope": "home.user",
+            **LOGIN_DATA,
             "username": self._username,
             "password": self._password,
         }
 
         if self._session is None:
-            self._session = ClientSession()
+            self._session = self._create_session()
             self._close_session = True
 
-        try:
-            async with asyncio.timeout(self._request_timeout):
-                request = await self._session.post(url=TOKEN_URL, data=data)
-                request.raise_for_status()
-        except asyncio.TimeoutError as err:
-            raise TadoConnectionError(
-                "Timeout occurred while connecting to Tado."
-            ) from err
-        except ClientResponseError as err:
-            await self.check_request_status(err, login=True)
+        response, body = await self._do_request(
+            self._session.post(url=TOKEN_URL, data=data, timeout=self._client_timeout),
+            login=True,
+        )
 
-        content_type = request.headers.get("content-type")
+        content_type = response.headers.get("content-type")
         if content_type and "application/json" not in content_type:
-            text = await request.text()
             raise TadoError(
                 "Unexpected response from Tado. Content-Type: "
-                f"{request.headers.get('content-type')}, "
-                f"Response body: {text}"
+                f"{response.headers.get('content-type')}, "
+                f"Response body: {body.decode(errors='replace')}"
             )
 
-        response = await request.json()
-        self._access_token = response["access_token"]
-        self._token_expiry = time.time() + float(response["expires_in"])
-        self._refesh_token = response["refresh_token"]
+        self._store_tokens(orjson.loads(body))
 
         get_me = await self.get_me()
         self._home_id = get_me.homes[0].id
+        self._home_base = TADO_API_BASE_URL / "homes" / str(self._home_id)
+
+    def _create_session(self) -> ClientSession:
+        """Create an internal client session with a keep-alive connection pool."""
+        # enable_cleanup_closed is left out: since aiohttp 3.11 it only warns on
+        # Python 3.12.7+, where the SSL transport leak it works around is fixed
+        connector = TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        return ClientSession(connector=connector, timeout=self._client_timeout)
+
+    async def _do_request(
+        self, request: Awaitable[ClientResponse], *, login: bool = False
+    ) -> tuple[ClientResponse, bytes]:
+        """Await a request and its body, raising the matching Tado exception.
+
+        The body is read inside the guarded block, so a timeout while
+        reading it is reported as a TadoConnectionError as well.
+        """
+        try:
+            response = await request
+            response.raise_for_status()
+            body = await response.read()
+        except asyncio.TimeoutError as err:
+            raise TadoConnectionError(
+                "Timeout occurred while connecting to Tado."
+            ) from err
+        except ClientResponseError as err:
+            await self.check_request_status(err, login=login)
+        return response, body
 
     async def check_request_status(
         self, response_error: ClientResponseError, *, login: bool = False
     ) -> None:
         """Check the status of the request and raise the proper exception if needed."""
-        status_error_mapping = {
-            500: TadoError(
-                "Error "
-                + str(response_error.status)
-                + " connecting to Tado. Response body: "
-                + response_error.message
-            ),
-            401: TadoAuthenticationError(
-                "Authentication error connecting to Tado. Response body: "
-                + response_error.message
-            ),
-            403: TadoForbiddenError(
-                "Forbidden error connecting to Tado. Response body: "
-                + response_error.message
-            ),
-        }
-
-        status_error_mapping[400] = TadoBadRequestError(
-            "Bad request to Tado. Response body: " + response_error.message
+        status = response_error.status
+        if status == 400 and login:
+            status = 401
+        error, description = STATUS_ERRORS.get(
+            status, (TadoError, f"Error {status} connecting to Tado")
         )
-        if login:
-            status_error_mapping[400] = TadoAuthenticationError(
-                "Authentication error connecting to Tado. Response body: "
-                + response_error.message
-            )
-
-        raise status_error_mapping[response_error.status]
+        raise error(f"{description}. Response body: {response_error.message}")
 
     async def _refresh_auth(self) -> None:
-        """Refresh the authentication token."""
-        if self._token_expiry is not None and time.time() < self._token_expiry - 30:
+        """Refresh the authentication token.
+
+        Concurrent callers are serialized on a lock, so only one of them
+        performs the refresh while the others reuse the new token.
+        """
+        if self._token_valid():
             return
 
-        data = {
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "grant_type": "refresh_token",
-            "scope": "home.user",
-            "refresh_token": self._refesh_token,
-        }
+        # Created lazily, inside the event loop that first refreshes the token
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
 
-        if self._session is None:
-            self._session = ClientSession()
-            self._close_session = True
+        async with self._auth_lock:
+            if self._token_valid():
+                return
 
-        try:
-            async with asyncio.timeout(self._request_timeout):
-                request = await self._session.post(url=TOKEN_URL, data=data)
-                request.raise_for_status()
-        except asyncio.TimeoutError as err:
-            raise TadoConnectionError(
-                "Timeout occurred while connecting to Tado."
-            ) from err
-        except ClientResponseError as err:
-            await self.check_request_status(err)
+            data = {**REFRESH_DATA, "refresh_token": self._refesh_token}
+
+            if self._session is None:
+                self._session = self._create_session()
+                self._close_session = True
+
+            _, body = await self._do_request(
+                self._session.post(
+                    url=TOKEN_URL, data=data, timeout=self._client_timeout
+                )
+            )
 
-        response = await request.json()
+            self._store_tokens(orjson.loads(body))
+
+    def _token_valid(self) -> bool:
+        """Return whether the access token is valid for at least 30 more seconds."""
+        return (
+            self._token_expiry is not None
+            and asyncio.get_running_loop().time() < self._token_expiry - 30
+        )
+
+    def _store_tokens(self, response: dict[str, Any]) -> None:
+        """Store the tokens of a token response and the matching headers.
+
+        The expiry is kept in event loop time, which is monotonic and thus
+        unaffected by wall clock adjustments.
+        """
         self._access_token = response["access_token"]
-        self._token_expiry = time.time() + float(response["expires_in"])
+        self._token_expiry = asyncio.get_running_loop().time() + float(
+            response["expires_in"]
+        )
         self._refesh_token = response["refresh_token"]
+        self._access_headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "User-Agent": USER_AGENT,
+        }
 
     async def get_me(self) -> GetMe:
         """Get the user information."""
@@ -226,25 +277,34 @@ class Tado:  # pylint: disable=too-many-instance-attributes
 
     async def get_devices(self) -> list[Device]:
         """Get the devices."""
-        response = await self._request(f"homes/{self._home_id}/devices")
-        obj = orjson.loads(response)
-        return [Device.from_dict(device) for device in obj]
+        return await self._get_list("devices", Device)
 
     async def get_mobile_devices(self) -> list[MobileDevice]:
         """Get the mobile devices."""
-        response = await self._request(f"homes/{self._home_id}/mobileDevices")
-        obj = orjson.loads(response)
-        return [MobileDevice.from_dict(device) for device in obj]
+        return await self._get_list("mobileDevices", MobileDevice)
 
     async def get_zones(self) -> list[Zone]:
         """Get the zones."""
-        response = await self._request(f"homes/{self._home_id}/zones")
-        obj = orjson.loads(response)
-        return [Zone.from_dict(zone) for zone in obj]
+        return await self._get_list("zones", Zone)
 
     async def get_zone_states(self) -> list[ZoneStates]:
         """Get the zone states."""
-        response = await self._request(f"homes/{self._home_id}/zoneStates")
+        response = await self._home_request("zoneStates")
+        return await self._parse(response, self._parse_zone_states)
+
+    async def _get_list(self, uri: str, model: type[_ModelT]) -> list[_ModelT]:
+        """Get a list of models from a path below the logged in home."""
+        response = await self._home_request(uri)
+        return await self._parse(response, self._parse_list, model)
+
+    @staticmethod
+    def _parse_list(response: bytes, model: type[_ModelT]) -> list[_ModelT]:
+        """Parse a JSON array response into a list of models."""
+        return list(map(model.from_dict, orjson.loads(response)))
+
+    @staticmethod
+    def _parse_zone_states(response: bytes) -> list[ZoneStates]:
+        """Parse a zone states response."""
         obj = orjson.loads(response)
         zone_states = {
             zone_id: ZoneState.from_dict(zone_state_dict)
@@ -252,21 +312,50 @@ class Tado:  # pylint: disable=too-many-instance-attributes
         }
         return [ZoneStates(zone_states=zone_states)]
 
+    async def _parse(
+        self, response: bytes, parser: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Parse a response, off the event loop if it is large.
+
+        Parsing a large payload can block the event loop for several
+        milliseconds, which stalls concurrent requests.
+        """
+        if len(response) > PARSE_IN_EXECUTOR_THRESHOLD:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, parser, response, *args
+            )
+        return parser(response, *args)
+
+    async def get_home_snapshot(self) -> HomeSnapshot:
+        """Get the devices, mobile devices, zones and zone states concurrently."""
+        devices, mobile_devices, zones, zone_states = await asyncio.gather(
+            self.get_devices(),
+            self.get_mobile_devices(),
+            self.get_zones(),
+            self.get_zone_states(),
+        )
+        return HomeSnapshot(
+            devices=devices,
+            mobile_devices=mobile_devices,
+            zones=zones,
+            zone_states=zone_states,
+        )
+
     async def get_zone_state(self, zone_id: int) -> ZoneState:
         """Get the zone state."""
-        response = await self._request(f"homes/{self._home_id}/zones/{zone_id}/state")
+        response = await self._home_request(f"zones/{zone_id}/state")
         zone_state = ZoneState.from_json(response)
         await self.update_zone_data(zone_state)
         return zone_state
 
     async def get_weather(self) -> Weather:
         """Get the weather."""
-        response = await self._request(f"homes/{self._home_id}/weather")
+        response = await self._home_request("weather")
         return Weather.from_json(response)
 
     async def get_home_state(self) -> HomeState:
         """Get the home state."""
-        response = await self._request(f"homes/{self._home_id}/state")
+        response = await self._home_request("state")
         home_state = HomeState.from_json(response)
         self._auto_geofencing_supported = (
             home_state.show_switch_to_auto_geofencing_button
@@ -277,21 +366,17 @@ class Tado:  # pylint: disable=too-many-instance-attributes
 
     async def get_capabilities(self, zone: int) -> Capabilities:
         """Get the capabilities."""
-        response = await self._request(
-            f"homes/{self._home_id}/zones/{zone}/capabilities"
-        )
+        response = await self._home_request(f"zones/{zone}/capabilities")
         return Capabilities.from_json(response)
 
     async def reset_zone_overlay(self, zone: int) -> None:
         """Reset the zone overlay."""
-        await self._request(
-            f"homes/{self._home_id}/zones/{zone}/overlay", method=HttpMethod.DELETE
-        )
+        await self._home_request(f"zones/{zone}/overlay", method=HttpMethod.DELETE)
 
     async def set_presence(self, presence: str) -> None:
         """Set the presence."""
-        await self._request(
-            f"homes/{self._home_id}/presenceLock",
+        await self._home_request(
+            "presenceLock",
             data={"homePresence": presence},
             method=HttpMethod.PUT,
         )
@@ -335,8 +420,8 @@ class Tado:  # pylint: disable=too-many-instance-attributes
                 **({"durationInSeconds": duration} if duration is not None else {}),
             },
         }
-        await self._request(
-            f"homes/{self._home_id}/zones/{zone}/overlay",
+        await self._home_request(
+            f"zones/{zone}/overlay",
             data=data,
             method=HttpMethod.PUT,
         )
@@ -370,7 +455,7 @@ class Tado:  # pylint: disable=too-many-instance-attributes
         response = await self._request(
             endpoint=EIQ_HOST_URL, data=payload, method=HttpMethod.POST
         )
-        return json.dumps(response)
+        return json.dumps(response.decode())
 
     async def _request(
         self,
@@ -378,42 +463,56 @@ class Tado:  # pylint: disable=too-many-instance-attributes
         endpoint: str = API_URL,
         data: dict[str, object] | None = None,
         method: HttpMethod = HttpMethod.GET,
-    ) -> str:
+    ) -> bytes:
         """Handle a request to the Tado API."""
-        await self._refresh_auth()
-
-        url = URL.build(scheme="https", host=TADO_HOST_URL, path=TADO_API_PATH)
-        if endpoint == EIQ_HOST_URL:
-            url = URL.build(scheme="https", host=EIQ_HOST_URL, path=EIQ_API_PATH)
+        url = EIQ_API_BASE_URL if endpoint == EIQ_HOST_URL else TADO_API_BASE_URL
 
         if uri:
             url = url.joinpath(uri)
 
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "User-Agent": f"HomeAssistant/{VERSION}",
-        }
+        return await self._raw_request(url, data=data, method=method)
+
+    async def _home_request(
+        self,
+        uri: str,
+        data: dict[str, object] | None = None,
+        method: HttpMethod = HttpMethod.GET,
+    ) -> bytes:
+        """Handle a request below the URL of the logged in home."""
+        if self._home_base is None:
+            raise TadoError("Not logged in to Tado.")
+        return await self._raw_request(self._home_base / uri, data=data, method=method)
+
+    async def _raw_request(
+        self,
+        url: URL,
+        data: dict[str, object] | None = None,
+        method: HttpMethod = HttpMethod.GET,
+    ) -> bytes:
+        """Handle a request to a fully built Tado URL."""
+        await self._refresh_auth()
 
+        headers = self._access_headers
         if method == HttpMethod.DELETE:
-            headers["Content-Type"] = "text/plain;charset=UTF-8"
+            headers = {**headers, "Content-Type": "text/plain;charset=UTF-8"}
         elif method == HttpMethod.PUT:
-            headers["Content-Type"] = "application/json;charset=UTF-8"
-            headers["Mime-Type"] = "application/json;charset=UTF-8"
-
-        try:
-            async with asyncio.timeout(self._request_timeout):
-                request = await self._session.request(  # type: ignore[union-attr]
-                    method=method.value, url=str(url), headers=headers, json=data
-                )
-                request.raise_for_status()
-        except asyncio.TimeoutError as err:
-            raise TadoConnectionError(
-                "Timeout occurred while connecting to Tado."
-            ) from err
-        except ClientResponseError as err:
-            await self.check_request_status(err)
+            headers = {
+                **headers,
+                "Content-Type": "application/json;charset=UTF-8",
+                "Mime-Type": "application/json;charset=UTF-8",
+            }
+
+        _, body = await self._do_request(
+            self._session.request(  # type: ignore[union-attr]
+                method=method.value,
+                url=url,
+                headers=headers,
+                json=data,
+                timeout=self._client_timeout,
+            )
+        )
 
-        return await request.text()
+        return body
 
     async def update_zone_data(self, data: ZoneState) -> None:  # pylint: disable=too-many-branches
         """Update the zone data."""
@@ -2,7 +2,6 @@
 
 import asyncio
 import os
-import time
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -18,7 +17,10 @@ from tadoasync.exceptions import (
     TadoBadRequestError,
     TadoConnectionError,
     TadoError,
+    TadoForbiddenError,
+    TadoServerError,
 )
+from yarl import URL
 
 from syrupy import SnapshotAssertion
 from tests import load_fixture
@@ -44,6 +46,45 @@ async def test_create_session(
         assert tado._session.closed
 
 
+async def test_request_client_timeout(
+    python_tado: Tado, responses: aioresponses
+) -> None:
+    """Test the request timeout is passed to aiohttp."""
+    responses.get(f"{TADO_API_URL}/me", status=200, body=load_fixture("me.json"))
+    await python_tado._request("me")
+    request = responses.requests[("GET", URL(f"{TADO_API_URL}/me"))][-1]
+    assert request.kwargs["timeout"] == aiohttp.ClientTimeout(total=10, connect=5)
+
+
+async def test_request_body_timeout(python_tado: Tado, responses: aioresponses) -> None:
+    """Test a timeout while reading the response body."""
+    responses.get(
+        f"{TADO_API_URL}/homes/1/devices",
+        status=200,
+        body=load_fixture("devices.json"),
+    )
+    with patch(
+        "aiohttp.ClientResponse.read", side_effect=asyncio.TimeoutError()
+    ), pytest.raises(TadoConnectionError):
+        await python_tado.get_devices()
+
+
+async def test_create_session_connector(responses: aioresponses) -> None:
+    """Test the internal session is created with a pooled connector."""
+    responses.get(
+        f"{TADO_API_URL}/me",
+        status=200,
+        body=load_fixture("me.json"),
+    )
+    tado = Tado(username="username", password="password")
+    await tado.login()
+    assert tado._session is not None
+    assert isinstance(tado._session.connector, aiohttp.TCPConnector)
+    assert tado._session.connector.limit_per_host == 10
+    await tado.close()
+    assert tado._session.closed
+
+
 async def test_close_session() -> None:
     """Test not closing the session when the session does not exist."""
     tado = Tado(username="username", password="password")
@@ -63,7 +104,7 @@ async def test_login_success(responses: aioresponses) -> None:
         await tado.login()
         assert tado._access_token == "test_access_token"
         assert tado._token_expiry is not None
-        assert tado._token_expiry > time.time()
+        assert tado._token_expiry > asyncio.get_running_loop().time()
         assert tado._refesh_token == "test_refresh_token"
 
 
@@ -79,7 +120,7 @@ async def test_login_success_no_session(responses: aioresponses) -> None:
         await tado.login()
         assert tado._access_token == "test_access_token"
         assert tado._token_expiry is not None
-        assert tado._token_expiry > time.time()
+        assert tado._token_expiry > asyncio.get_running_loop().time()
         assert tado._refesh_token == "test_refresh_token"
 
 
@@ -142,11 +183,12 @@ async def test_refresh_auth_success(responses: aioresponses) -> None:
     async with aiohttp.ClientSession() as session:
         tado = Tado(username="username", password="password", session=session)
         tado._access_token = "old_test_access_token"
-        tado._token_expiry = time.time() - 10  # make sure the token is expired
+        # make sure the token is expired
+        tado._token_expiry = asyncio.get_running_loop().time() - 10
         tado._refesh_token = "old_test_refresh_token"
         await tado._refresh_auth()
         assert tado._access_token == "test_access_token"
-        assert tado._token_expiry > time.time()
+        assert tado._token_expiry > asyncio.get_running_loop().time()
         assert tado._refesh_token == "test_refresh_token"
 
 
@@ -158,7 +200,8 @@ async def test_refresh_auth_timeout(python_tado: Tado, responses: aioresponses)
     )
     async with aiohttp.ClientSession():
         python_tado._access_token = "old_test_access_token"
-        python_tado._token_expiry = time.time() - 10  # make sure the token is expired
+        # make sure the token is expired
+        python_tado._token_expiry = asyncio.get_running_loop().time() - 10
         python_tado._refesh_token = "old_test_refresh_token"
         with pytest.raises(TadoConnectionError):
             await python_tado._refresh_auth()
@@ -179,7 +222,8 @@ async def test_refresh_auth_client_response_error(python_tado: Tado) -> None:
 
     with patch("aiohttp.ClientSession.post", new=mock_post):
         python_tado._access_token = "old_test_access_token"
-        python_tado._token_expiry = time.time() - 10  # make sure the token is expired
+        # make sure the token is expired
+        python_tado._token_expiry = asyncio.get_running_loop().time() - 10
         python_tado._refesh_token = "old_test_refresh_token"
         with pytest.raises(TadoBadRequestError):
             await python_tado._refresh_auth()
@@ -197,6 +241,17 @@ async def test_get_me(
     assert await python_tado.get_me() == snapshot
 
 
+async def test_home_request_not_logged_in() -> None:
+    """Test home requests need a logged in home."""
+    tado = Tado(username="username", password="password")
+    with pytest.raises(TadoError):
+        await tado.get_devices()
+    with pytest.raises(TadoError):
+        await tado.get_weather()
+    with pytest.raises(TadoError):
+        await tado.set_presence("HOME")
+
+
 async def test_get_devices(
     python_tado: Tado, responses: aioresponses, snapshot: SnapshotAssertion
 ) -> None:
@@ -268,6 +323,86 @@ async def test_get_zone_states_ac_power(
     assert await python_tado.get_zone_states() == snapshot
 
 
+async def test_get_home_snapshot(python_tado: Tado, responses: aioresponses) -> None:
+    """Test get home snapshot."""
+    for uri, fixture in (
+        ("devices", "devices.json"),
+        ("mobileDevices", "mobile_devices.json"),
+        ("zones", "zones.json"),
+        ("zoneStates", "zone_states_heating_power.json"),
+    ):
+        responses.get(
+            f"{TADO_API_URL}/homes/1/{uri}",
+            status=200,
+            body=load_fixture(fixture),
+            repeat=True,
+        )
+    home_snapshot = await python_tado.get_home_snapshot()
+    assert home_snapshot.devices == await python_tado.get_devices()
+    assert home_snapshot.mobile_devices == await python_tado.get_mobile_devices()
+    assert home_snapshot.zones == await python_tado.get_zones()
+    assert home_snapshot.zone_states == await python_tado.get_zone_states()
+
+
+async def test_refresh_auth_concurrent(responses: aioresponses) -> None:
+    """Test concurrent refreshes only request a new token once."""
+    token_requested = asyncio.Event()
+    release_token = asyncio.Event()
+
+    async def token_handler(_: URL, **_kwargs: Any) -> CallbackResult:
+        """Suspend the token request so the other refreshes contend on the lock."""
+        token_requested.set()
+        await release_token.wait()
+        return CallbackResult(
+            payload={
+                "access_token": "new_test_access_token",
+                "expires_in": 3600,
+                "refresh_token": "new_test_refresh_token",
+            }
+        )
+
+    async with aiohttp.ClientSession() as session:
+        tado = Tado(username="username", password="password", session=session)
+        await tado.login()
+        # The lock is only created once a refresh is needed
+        assert tado._auth_lock is None
+        responses.post(TADO_TOKEN_URL, callback=token_handler)
+        # make sure the token is expired
+        tado._token_expiry = asyncio.get_running_loop().time() - 10
+        refreshes = [asyncio.create_task(tado._refresh_auth()) for _ in range(5)]
+        await token_requested.wait()
+        release_token.set()
+        await asyncio.gather(*refreshes)
+
+        # One POST for the login and a single one for all refreshes
+        assert len(responses.requests[("POST", URL(TADO_TOKEN_URL))]) == 2
+        assert tado._access_token == "new_test_access_token"
+        assert isinstance(tado._auth_lock, asyncio.Lock)
+
+
+async def test_parse_in_executor(python_tado: Tado, responses: aioresponses) -> None:
+    """Test large responses are parsed the same way in an executor."""
+    for uri, fixture in (
+        ("devices", "devices.json"),
+        ("zoneStates", "zone_states_heating_power.json"),
+    ):
+        responses.get(
+            f"{TADO_API_URL}/homes/1/{uri}",
+            status=200,
+            body=load_fixture(fixture),
+            repeat=True,
+        )
+    devices = await python_tado.get_devices()
+    zone_states = await python_tado.get_zone_states()
+    loop = asyncio.get_running_loop()
+    with patch("tadoasync.tadoasync.PARSE_IN_EXECUTOR_THRESHOLD", 0), patch.object(
+        loop, "run_in_executor", wraps=loop.run_in_executor
+    ) as mock_run_in_executor:
+        assert await python_tado.get_devices() == devices
+        assert await python_tado.get_zone_states() == zone_states
+        assert mock_run_in_executor.call_count == 2
+
+
 async def test_get_weather(
     python_tado: Tado, responses: aioresponses, snapshot: SnapshotAssertion
 ) -> None:
@@ -465,6 +600,29 @@ async def test_request_client_response_error(python_tado: Tado) -> None:
         await python_tado._request("me")
 
 
+@pytest.mark.parametrize(
+    ("status", "exception"),
+    [
+        (400, TadoBadRequestError),
+        (401, TadoAuthenticationError),
+        (403, TadoForbiddenError),
+        (404, TadoError),
+        (500, TadoServerError),
+        (502, TadoError),
+    ],
+)
+async def test_request_status_errors(
+    python_tado: Tado,
+    responses: aioresponses,
+    status: int,
+    exception: type,
+) -> None:
+    """Test the exception raised for each error status."""
+    responses.get(f"{TADO_API_URL}/me", status=status)
+    with pytest.raises(exception):
+        await python_tado._request("me")
+
+
 fixtures_files = [
     f for f in os.listdir("tests/fixtures/zone_state") if f.endswith(".json")
 ]
@@ -517,20 +675,14 @@ async def test_get_me_timeout(responses: aioresponses) -> None:
         body=load_fixture("me.json"),
     )
 
-    # Faking a timeout by sleeping
-    async def response_handler(_: str, **_kwargs: Any) -> CallbackResult:  # pylint: disable=unused-argument
-        """Response handler for this test."""
-        await asyncio.sleep(1)  # Simulate a delay that exceeds the request timeout
-        return CallbackResult(body="Goodmorning!")
-
+    # aiohttp raises the timeout from the request once the ClientTimeout expires
     responses.get(
         f"{TADO_API_URL}/homes/1/devices",
-        body=load_fixture("devices.json"),
-        callback=response_handler,
+        exception=asyncio.TimeoutError(),
     )
 
     async with aiohttp.ClientSession() as session, Tado(
-        username="username", password="password", request_timeout=0, session=session
+        username="username", password="password", request_timeout=1, session=session
     ) as tado:
         with pytest.raises(TadoConnectionError):
             assert await tado.get_devices()